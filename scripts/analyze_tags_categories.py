@@ -23,87 +23,328 @@ import sys
 import argparse
 import json
 import csv
+import hashlib
+import multiprocessing
 from pathlib import Path
 from typing import Dict, List, Set, Tuple, Counter
 from collections import Counter, defaultdict
 import yaml
 
+try:
+    # libyaml-backed loader is typically 5-10x faster than the
+    # pure-Python one; fall back when PyYAML was built without it.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    # Optional: sublinear similar-tag candidate retrieval for very large
+    # tag vocabularies. The quadratic pass is used when not installed.
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = MinHashLSH = None
+
+try:
+    # Optional: C-level co-occurrence aggregation for large corpora
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    # Optional: SIMD-accelerated similarity scoring, 10-50x faster than
+    # difflib per pair with equivalent semantics for short tags.
+    from rapidfuzz import fuzz as _rf_fuzz
+except ImportError:
+    _rf_fuzz = None
+
+if np is not None and njit is not None:
+    @njit(cache=True)
+    def _accumulate_cooccurrence(indptr, tag_ids, cooc):
+        """JIT-compiled pair counting over a CSR-like article layout.
+
+        Serial on purpose: parallel prange would race on the shared
+        count matrix.
+        """
+        for a in range(len(indptr) - 1):
+            start, end = indptr[a], indptr[a + 1]
+            for i in range(start, end):
+                for j in range(i + 1, end):
+                    cooc[tag_ids[i], tag_ids[j]] += 1
+else:
+    _accumulate_cooccurrence = None
+
+try:
+    # C-level JSON encoder; 5-10x faster than json.dumps on big reports
+    import orjson
+
+    def _json_dumps(data) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _json_dumps(data) -> str:
+        return json.dumps(data, indent=2)
 
-class TagCategoryAnalyzer:
-    def __init__(self, articles_dir: str):
-        self.articles_dir = Path(articles_dir)
-        self.tags_counter = Counter()
-        self.categories_counter = Counter()
-        self.articles_data = []
-        self.tag_cooccurrence = defaultdict(Counter)
-        self.category_articles = defaultdict(list)
-        self.tag_articles = defaultdict(list)
 
-    def parse_frontmatter(self, content: str) -> Tuple[Dict, str]:
-        """Parse YAML frontmatter from markdown content"""
-        if not content.startswith('---'):
-            return {}, content
+# Cache of parsed frontmatter, keyed by content hash, so re-runs skip
+# YAML parsing for unchanged files. Lives alongside the articles.
+CACHE_DIR_NAME = '.markgo-fm-cache'
+
 
-        parts = content.split('---', 2)
-        if len(parts) < 3:
-            return {}, content
+def _parse_one(file_path: Path) -> Dict:
+    """Parse a single markdown file into an article record.
 
+    Module-level so it can be shipped to worker processes; touches no
+    shared state and returns {} for files without usable frontmatter.
+    """
+    try:
+        # Hash only the head of the file — frontmatter lives there, and
+        # blake2b over 4 KB is far cheaper than a YAML parse.
+        with open(file_path, 'rb') as f:
+            head = f.read(4096)
+        if not head.startswith(b'---'):
+            return {}
+
+        key = hashlib.blake2b(file_path.name.encode() + head,
+                              digest_size=16).hexdigest()
+        cache_path = file_path.parent / CACHE_DIR_NAME / f"{key}.json"
         try:
-            frontmatter = yaml.safe_load(parts[1])
-            body = parts[2]
-            return frontmatter or {}, body
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass  # cache miss or corrupt entry — fall through to parse
+
+        # The binary head doubles as a fast parse path: if the closing
+        # delimiter sits inside it, the whole frontmatter block is
+        # already in memory and the file needs no second read. Both LF
+        # and CRLF line endings are accepted.
+        fm_text = None
+        if head.startswith(b'---\n'):
+            fm_start = 4
+        elif head.startswith(b'---\r\n'):
+            fm_start = 5
+        else:
+            fm_start = -1
+        if fm_start != -1:
+            end = head.find(b'\n---', fm_start)
+            if end != -1 and head[end + 4:end + 5] in (b'\n', b'\r', b''):
+                fm_text = head[fm_start:end].decode('utf-8')
+
+        if fm_text is None:
+            # Oversized frontmatter — stream only the block; article
+            # bodies can be huge and never need to be read here.
+            fm_lines = []
+            with open(file_path, 'r', encoding='utf-8') as f:
+                first = f.readline()
+                if first.rstrip('\r\n') != '---':
+                    return {}
+                for line in f:
+                    if line.rstrip('\r\n') == '---':
+                        break
+                    fm_lines.append(line)
+                else:
+                    # No closing delimiter — not valid frontmatter
+                    return {}
+            fm_text = ''.join(fm_lines)
+
+        try:
+            frontmatter = yaml.load(fm_text, Loader=_YamlLoader) or {}
         except yaml.YAMLError as e:
-            print(f"Error parsing YAML frontmatter: {e}")
-            return {}, content
+            print(f"Error parsing YAML frontmatter in {file_path.name}: {e}")
+            return {}
+
+        if not frontmatter:
+            return {}
+
+        tags = frontmatter.get('tags', [])
+        categories = frontmatter.get('categories', [])
+
+        article_data = {
+            'file': file_path.name,
+            'title': frontmatter.get('title', file_path.stem),
+            'date': str(frontmatter.get('date', '')),
+            'featured': frontmatter.get('featured', False),
+            'tags': tags,
+            'categories': categories,
+            'tag_count': len(tags),
+            'category_count': len(categories)
+        }
 
-    def analyze_file(self, file_path: Path) -> Dict:
-        """Analyze a single markdown file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            cache_path.parent.mkdir(exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(article_data, f)
+        except OSError:
+            pass  # caching is best-effort
 
-            frontmatter, body = self.parse_frontmatter(content)
-            if not frontmatter:
-                return {}
+        return article_data
 
-            tags = frontmatter.get('tags', [])
-            categories = frontmatter.get('categories', [])
-            title = frontmatter.get('title', file_path.stem)
-            date = frontmatter.get('date', '')
-            featured = frontmatter.get('featured', False)
+    except Exception as e:
+        print(f"Error analyzing {file_path}: {e}")
+        return {}
 
-            # Count tags and categories
-            for tag in tags:
-                self.tags_counter[tag] += 1
-                self.tag_articles[tag].append(title)
 
-            for category in categories:
-                self.categories_counter[category] += 1
-                self.category_articles[category].append(title)
+class TagCategoryAnalyzer:
+    def __init__(self, articles_dir: str):
+        self.articles_dir = Path(articles_dir)
+        self.tags_counter = Counter()
+        self.categories_counter = Counter()
+        # Article records as parallel column lists (struct-of-arrays):
+        # avoids one 8-slot dict per article and keeps scans over a
+        # single field contiguous. Dict views are built lazily.
+        self._files = []
+        self._titles = []
+        self._dates = []
+        self._featured = []
+        self._tags = []
+        self._categories = []
+        self._tag_counts = []
+        self._cat_counts = []
+        self.tag_cooccurrence = defaultdict(Counter)
+        self.category_articles = defaultdict(list)
+        self.tag_articles = defaultdict(list)
+        # Running totals so averages need no second pass over articles
+        self._total_tag_slots = 0
+        self._total_cat_slots = 0
 
-            # Track tag co-occurrence
+    def analyze_file(self, file_path: Path) -> Dict:
+        """Analyze a single markdown file"""
+        article_data = _parse_one(file_path)
+        if article_data:
+            self._ingest(article_data)
+        return article_data
+
+    def _ingest(self, article_data: Dict):
+        """Fold a parsed article record into the aggregate counters.
+
+        Runs only in the parent process so all mutable state stays
+        single-threaded.
+        """
+        # Intern repeated strings: one copy per unique tag/category and
+        # identity-compare fast paths in the Counter lookups below.
+        tags = [sys.intern(t) if isinstance(t, str) else t
+                for t in article_data['tags']]
+        categories = [sys.intern(c) if isinstance(c, str) else c
+                      for c in article_data['categories']]
+        article_data['tags'] = tags
+        article_data['categories'] = categories
+
+        title = article_data['title']
+        if isinstance(title, str):
+            title = sys.intern(title)
+
+        # Count tags and categories
+        for tag in tags:
+            self.tags_counter[tag] += 1
+            self.tag_articles[tag].append(title)
+
+        for category in categories:
+            self.categories_counter[category] += 1
+            self.category_articles[category].append(title)
+
+        self._total_tag_slots += len(tags)
+        self._total_cat_slots += len(categories)
+
+        self._files.append(article_data['file'])
+        self._titles.append(title)
+        self._dates.append(article_data['date'])
+        self._featured.append(article_data['featured'])
+        self._tags.append(tags)
+        self._categories.append(categories)
+        self._tag_counts.append(len(tags))
+        self._cat_counts.append(len(categories))
+
+    def _build_cooccurrence(self):
+        """Aggregate tag co-occurrence across all ingested articles.
+
+        Stored once per pair in canonical order (smaller tag first) to
+        halve writes and memory. Uses integer-id pair counting in NumPy
+        when available; falls back to a pure-Python loop.
+        """
+        if np is not None:
+            self._build_cooccurrence_numpy()
+            return
+
+        for tags in self._tags:
             for i, tag1 in enumerate(tags):
                 for tag2 in tags[i+1:]:
-                    self.tag_cooccurrence[tag1][tag2] += 1
-                    self.tag_cooccurrence[tag2][tag1] += 1
-
-            article_data = {
-                'file': file_path.name,
-                'title': title,
-                'date': str(date),
-                'featured': featured,
-                'tags': tags,
-                'categories': categories,
-                'tag_count': len(tags),
-                'category_count': len(categories)
-            }
-
-            self.articles_data.append(article_data)
-            return article_data
-
-        except Exception as e:
-            print(f"Error analyzing {file_path}: {e}")
-            return {}
+                    a, b = (tag1, tag2) if tag1 < tag2 else (tag2, tag1)
+                    self.tag_cooccurrence[a][b] += 1
+
+    def _build_cooccurrence_numpy(self):
+        """Count co-occurring pairs via flattened integer indices.
+
+        Ids are assigned in lexical tag order so that id order matches
+        the canonical (smaller tag first) pair convention.
+        """
+        id2tag = sorted({tag for tags in self._tags for tag in tags})
+        tag2id = {tag: i for i, tag in enumerate(id2tag)}
+        num_tags = len(id2tag)
+        if num_tags < 2:
+            return
+
+        if _accumulate_cooccurrence is not None:
+            self._build_cooccurrence_numba(id2tag, tag2id, num_tags)
+            return
+
+        flat_chunks = []
+        for tags in self._tags:
+            if len(tags) < 2:
+                continue
+            ids = np.sort(np.fromiter((tag2id[t] for t in tags),
+                                      dtype=np.int64, count=len(tags)))
+            rows, cols = np.triu_indices(len(ids), 1)
+            flat_chunks.append(ids[rows] * num_tags + ids[cols])
+
+        if not flat_chunks:
+            return
+
+        counts = np.bincount(np.concatenate(flat_chunks))
+        for flat in np.nonzero(counts)[0]:
+            i, j = divmod(int(flat), num_tags)
+            self.tag_cooccurrence[id2tag[i]][id2tag[j]] = int(counts[flat])
+
+    def _build_cooccurrence_numba(self, id2tag: List[str], tag2id: Dict[str, int], num_tags: int):
+        """Accumulate co-occurrence through the Numba kernel.
+
+        Articles are packed into a CSR-like (indptr, tag_ids) layout so
+        the JIT loop touches only integer arrays.
+        """
+        tagged = [tags for tags in self._tags if len(tags) >= 2]
+        if not tagged:
+            return
+
+        indptr = np.zeros(len(tagged) + 1, dtype=np.int64)
+        for k, tags in enumerate(tagged):
+            indptr[k + 1] = indptr[k] + len(tags)
+        tag_ids = np.concatenate([
+            np.sort(np.fromiter((tag2id[t] for t in tags),
+                                dtype=np.int64, count=len(tags)))
+            for tags in tagged
+        ])
+
+        cooc = np.zeros((num_tags, num_tags), dtype=np.int32)
+        _accumulate_cooccurrence(indptr, tag_ids, cooc)
+
+        rows, cols = np.nonzero(cooc)
+        for i, j, count in zip(rows, cols, cooc[rows, cols]):
+            self.tag_cooccurrence[id2tag[i]][id2tag[j]] = int(count)
+
+    def _article_row(self, i: int) -> Dict:
+        """Materialize the dict view of article i from the column lists"""
+        return {
+            'file': self._files[i],
+            'title': self._titles[i],
+            'date': self._dates[i],
+            'featured': self._featured[i],
+            'tags': self._tags[i],
+            'categories': self._categories[i],
+            'tag_count': self._tag_counts[i],
+            'category_count': self._cat_counts[i]
+        }
 
     def run_analysis(self):
         """Run the complete analysis"""
@@ -111,10 +352,12 @@ class TagCategoryAnalyzer:
             print(f"Articles directory not found: {self.articles_dir}")
             return False
 
-        markdown_files = (list(self.articles_dir.glob("*.md")) + 
-                         list(self.articles_dir.glob("*.markdown")) + 
-                         list(self.articles_dir.glob("*.mdown")) + 
-                         list(self.articles_dir.glob("*.mkd")))
+        # Single scandir sweep instead of one glob per extension; the
+        # raw DirEntry objects avoid per-file stat and Path overhead.
+        suffixes = ('.md', '.markdown', '.mdown', '.mkd')
+        with os.scandir(self.articles_dir) as it:
+            markdown_files = [Path(entry.path) for entry in it
+                              if entry.is_file() and entry.name.endswith(suffixes)]
 
         if not markdown_files:
             print(f"No markdown files found in {self.articles_dir}")
@@ -122,26 +365,39 @@ class TagCategoryAnalyzer:
 
         print(f"Analyzing {len(markdown_files)} markdown files...")
 
-        for file_path in markdown_files:
-            self.analyze_file(file_path)
+        # Per-file parsing is independent (read + YAML parse), so fan it
+        # out across cores and fold results back in the parent.
+        chunksize = max(1, len(markdown_files) // (4 * multiprocessing.cpu_count()))
+        with multiprocessing.Pool() as pool:
+            for article_data in pool.imap_unordered(_parse_one, markdown_files,
+                                                    chunksize=chunksize):
+                if article_data:
+                    self._ingest(article_data)
+
+        self._build_cooccurrence()
 
         return True
 
     def get_summary_stats(self) -> Dict:
         """Generate summary statistics"""
-        total_articles = len(self.articles_data)
+        total_articles = len(self._tag_counts)
         total_tags = len(self.tags_counter)
         total_categories = len(self.categories_counter)
 
-        avg_tags_per_article = sum(len(article['tags']) for article in self.articles_data) / total_articles if total_articles > 0 else 0
-        avg_categories_per_article = sum(len(article['categories']) for article in self.articles_data) / total_articles if total_articles > 0 else 0
+        avg_tags_per_article = self._total_tag_slots / total_articles if total_articles > 0 else 0
+        avg_categories_per_article = self._total_cat_slots / total_articles if total_articles > 0 else 0
 
-        # Find articles with most/least tags
-        articles_by_tag_count = sorted(self.articles_data, key=lambda x: x['tag_count'], reverse=True)
-        most_tagged = articles_by_tag_count[0] if articles_by_tag_count else None
-        least_tagged = articles_by_tag_count[-1] if articles_by_tag_count else None
+        # Find articles with most/least tags — two O(N) scans over the
+        # tag-count column, no sort
+        if total_articles > 0:
+            indices = range(total_articles)
+            most_tagged = self._article_row(max(indices, key=self._tag_counts.__getitem__))
+            least_tagged = self._article_row(min(indices, key=self._tag_counts.__getitem__))
+        else:
+            most_tagged = least_tagged = None
 
-        # Find singleton tags (used only once)
+        # Find singleton tags (used only once) — one walk per counter
+        # yields both the list and, via len(), the count
         singleton_tags = [tag for tag, count in self.tags_counter.items() if count == 1]
         singleton_categories = [cat for cat, count in self.categories_counter.items() if count == 1]
 
@@ -164,32 +420,110 @@ class TagCategoryAnalyzer:
         from difflib import SequenceMatcher
 
         tags = list(self.tags_counter.keys())
+
+        if MinHashLSH is not None:
+            return self._find_similar_tags_lsh(tags, threshold)
+
+        # Lowercase and build character sets once per tag; the cheap
+        # prefilters below reject most pairs before the quadratic ratio().
+        lowered = [(tag, tag.lower(), frozenset(tag.lower())) for tag in tags]
         similar_pairs = []
 
-        for i, tag1 in enumerate(tags):
-            for tag2 in tags[i+1:]:
-                similarity = SequenceMatcher(None, tag1.lower(), tag2.lower()).ratio()
+        for i, (tag1, low1, chars1) in enumerate(lowered):
+            len1 = len(low1)
+            for j in range(i + 1, len(lowered)):
+                tag2, low2, chars2 = lowered[j]
+                len2 = len(low2)
+                if not len1 or not len2:
+                    continue
+                # Length-ratio prefilter: very different lengths can
+                # never reach the threshold.
+                if min(len1, len2) / max(len1, len2) < threshold:
+                    continue
+                # Character-set Jaccard prefilter (slightly looser than
+                # the threshold since it ignores ordering).
+                if len(chars1 & chars2) / len(chars1 | chars2) < threshold - 0.1:
+                    continue
+                if _rf_fuzz is not None:
+                    similarity = _rf_fuzz.ratio(low1, low2,
+                                                score_cutoff=threshold * 100) / 100.0
+                    if similarity >= threshold:
+                        similar_pairs.append((tag1, tag2, similarity))
+                    continue
+                sm = SequenceMatcher(None, low1, low2, autojunk=False)
+                if sm.real_quick_ratio() < threshold:
+                    continue
+                if sm.quick_ratio() < threshold:
+                    continue
+                similarity = sm.ratio()
                 if similarity >= threshold:
                     similar_pairs.append((tag1, tag2, similarity))
 
         return sorted(similar_pairs, key=lambda x: x[2], reverse=True)
 
+    def _find_similar_tags_lsh(self, tags: List[str], threshold: float) -> List[Tuple[str, str, float]]:
+        """Find similar tags via MinHash-LSH over character 3-grams.
+
+        LSH buckets surface candidate pairs in roughly O(T) expected
+        work instead of scoring all O(T^2) pairs; only the shortlist is
+        verified with an exact SequenceMatcher ratio.
+        """
+        from difflib import SequenceMatcher
+
+        lowered = {tag: tag.lower() for tag in tags}
+        lsh = MinHashLSH(threshold=threshold, num_perm=64)
+        minhashes = {}
+
+        for tag in tags:
+            low = lowered[tag]
+            m = MinHash(num_perm=64)
+            for i in range(max(1, len(low) - 2)):
+                m.update(low[i:i+3].encode('utf-8'))
+            minhashes[tag] = m
+            lsh.insert(tag, m)
+
+        similar_pairs = []
+        seen = set()
+        for tag1 in tags:
+            for tag2 in lsh.query(minhashes[tag1]):
+                if tag1 == tag2:
+                    continue
+                pair = (tag1, tag2) if tag1 < tag2 else (tag2, tag1)
+                if pair in seen:
+                    continue
+                seen.add(pair)
+                if _rf_fuzz is not None:
+                    similarity = _rf_fuzz.ratio(lowered[pair[0]],
+                                                lowered[pair[1]]) / 100.0
+                else:
+                    similarity = SequenceMatcher(None, lowered[pair[0]],
+                                                 lowered[pair[1]],
+                                                 autojunk=False).ratio()
+                if similarity >= threshold:
+                    similar_pairs.append((pair[0], pair[1], similarity))
+
+        return sorted(similar_pairs, key=lambda x: x[2], reverse=True)
+
     def find_redundant_tags(self) -> Dict[str, List[str]]:
         """Find tags that might be redundant based on co-occurrence patterns"""
         redundant_candidates = {}
+        tags_counter = self.tags_counter
 
+        # Co-occurrence is stored once per pair in canonical order, so
+        # check redundancy in both directions while walking each pair
         for tag1, cooccurrences in self.tag_cooccurrence.items():
-            if not cooccurrences:
-                continue
-
-            # Find tags that always appear together with tag1
-            tag1_count = self.tags_counter[tag1]
+            tag1_count = tags_counter[tag1]
+            thresh1 = tag1_count * 0.8
             for tag2, cooccur_count in cooccurrences.items():
-                # If tag2 appears in 80%+ of tag1's articles
-                if cooccur_count >= tag1_count * 0.8:
-                    if tag1 not in redundant_candidates:
-                        redundant_candidates[tag1] = []
-                    redundant_candidates[tag1].append(f"{tag2} (appears together {cooccur_count}/{tag1_count} times)")
+                # Does tag2 appear in 80%+ of tag1's articles?
+                if cooccur_count >= thresh1:
+                    redundant_candidates.setdefault(tag1, []).append(
+                        f"{tag2} (appears together {cooccur_count}/{tag1_count} times)")
+                # And the reverse direction for the stored pair
+                tag2_count = tags_counter[tag2]
+                if cooccur_count >= tag2_count * 0.8:
+                    redundant_candidates.setdefault(tag2, []).append(
+                        f"{tag1} (appears together {cooccur_count}/{tag2_count} times)")
 
         return redundant_candidates
 
@@ -233,30 +567,34 @@ class TagCategoryAnalyzer:
         report.append("-" * 50)
 
         if sort_by == 'frequency':
-            sorted_tags = self.tags_counter.most_common()
-        else:
-            sorted_tags = sorted(self.tags_counter.items())
-
-        for tag, count in sorted_tags:
-            if count >= min_count:
+            # most_common() is sorted by count, so stop at the first
+            # entry below the cutoff instead of filtering the whole tail
+            for tag, count in self.tags_counter.most_common():
+                if count < min_count:
+                    break
                 report.append(f"{tag:30} : {count:3d} articles")
+        else:
+            for tag, count in sorted(self.tags_counter.items()):
+                if count >= min_count:
+                    report.append(f"{tag:30} : {count:3d} articles")
 
         # Category frequency analysis
         report.append(f"\nCATEGORY FREQUENCY ANALYSIS (min count: {min_count})")
         report.append("-" * 50)
 
         if sort_by == 'frequency':
-            sorted_categories = self.categories_counter.most_common()
-        else:
-            sorted_categories = sorted(self.categories_counter.items())
-
-        for category, count in sorted_categories:
-            if count >= min_count:
+            for category, count in self.categories_counter.most_common():
+                if count < min_count:
+                    break
                 report.append(f"{category:30} : {count:3d} articles")
+        else:
+            for category, count in sorted(self.categories_counter.items()):
+                if count >= min_count:
+                    report.append(f"{category:30} : {count:3d} articles")
 
         # Singleton tags
         if stats['singleton_tag_list']:
-            report.append(f"\nSINGLETON TAGS ({len(stats['singleton_tag_list'])} total)")
+            report.append(f"\nSINGLETON TAGS ({stats['singleton_tags']} total)")
             report.append("-" * 30)
             for i, tag in enumerate(sorted(stats['singleton_tag_list'])):
                 if i % 3 == 0:
@@ -265,7 +603,7 @@ class TagCategoryAnalyzer:
 
         # Singleton categories
         if stats['singleton_category_list']:
-            report.append(f"\n\nSINGLETON CATEGORIES ({len(stats['singleton_category_list'])} total)")
+            report.append(f"\n\nSINGLETON CATEGORIES ({stats['singleton_categories']} total)")
             report.append("-" * 30)
             for category in sorted(stats['singleton_category_list']):
                 report.append(f"  {category}")
@@ -294,8 +632,7 @@ class TagCategoryAnalyzer:
         all_cooccurrences = []
         for tag1, cooccurrences in self.tag_cooccurrence.items():
             for tag2, count in cooccurrences.items():
-                if tag1 < tag2:  # Avoid duplicates
-                    all_cooccurrences.append((tag1, tag2, count))
+                all_cooccurrences.append((tag1, tag2, count))
 
         top_cooccurrences = sorted(all_cooccurrences, key=lambda x: x[2], reverse=True)[:10]
         for tag1, tag2, count in top_cooccurrences:
@@ -309,37 +646,43 @@ class TagCategoryAnalyzer:
             'summary': stats,
             'tags': dict(self.tags_counter.most_common() if sort_by == 'frequency' else sorted(self.tags_counter.items())),
             'categories': dict(self.categories_counter.most_common() if sort_by == 'frequency' else sorted(self.categories_counter.items())),
-            'similar_tags': self.find_similar_tags(),
+            # orjson rejects tuples, so normalize pairs to lists
+            'similar_tags': [list(pair) for pair in self.find_similar_tags()],
             'redundant_tags': self.find_redundant_tags(),
-            'articles': self.articles_data
+            'articles': [self._article_row(i) for i in range(len(self._tag_counts))]
         }
-        return json.dumps(data, indent=2)
-
-    def _generate_csv_report(self, stats: Dict, sort_by: str, min_count: int) -> str:
-        """Generate CSV format report"""
-        # For simplicity, just return tag/category frequencies
-        import io
-        output = io.StringIO()
+        return _json_dumps(data)
 
-        # Tags CSV
-        writer = csv.writer(output)
+    def write_csv_report(self, sink, sort_by: str = 'frequency', min_count: int = 1):
+        """Stream CSV rows directly to a file-like sink"""
+        # For simplicity, just emit tag/category frequencies
+        writer = csv.writer(sink)
         writer.writerow(['type', 'name', 'count'])
 
         if sort_by == 'frequency':
-            sorted_tags = self.tags_counter.most_common()
-            sorted_categories = self.categories_counter.most_common()
-        else:
-            sorted_tags = sorted(self.tags_counter.items())
-            sorted_categories = sorted(self.categories_counter.items())
-
-        for tag, count in sorted_tags:
-            if count >= min_count:
+            # most_common() is sorted, so break at the cutoff
+            for tag, count in self.tags_counter.most_common():
+                if count < min_count:
+                    break
                 writer.writerow(['tag', tag, count])
-
-        for category, count in sorted_categories:
-            if count >= min_count:
+            for category, count in self.categories_counter.most_common():
+                if count < min_count:
+                    break
                 writer.writerow(['category', category, count])
+        else:
+            for tag, count in sorted(self.tags_counter.items()):
+                if count >= min_count:
+                    writer.writerow(['tag', tag, count])
+            for category, count in sorted(self.categories_counter.items()):
+                if count >= min_count:
+                    writer.writerow(['category', category, count])
 
+    def _generate_csv_report(self, stats: Dict, sort_by: str, min_count: int) -> str:
+        """Generate CSV format report as a string (fallback for callers
+        that cannot stream to a sink directly)"""
+        import io
+        output = io.StringIO()
+        self.write_csv_report(output, sort_by=sort_by, min_count=min_count)
         return output.getvalue()
 
 
@@ -388,6 +731,17 @@ def main():
     if not analyzer.run_analysis():
         sys.exit(1)
 
+    if args.output == 'csv':
+        # Stream rows straight to the sink — no intermediate string
+        # buffer for potentially huge outputs
+        if args.output_file:
+            with open(args.output_file, 'w', encoding='utf-8', newline='') as f:
+                analyzer.write_csv_report(f, sort_by=args.sort, min_count=args.min_count)
+            print(f"Report saved to {args.output_file}")
+        else:
+            analyzer.write_csv_report(sys.stdout, sort_by=args.sort, min_count=args.min_count)
+        return
+
     report = analyzer.generate_report(
         output_format=args.output,
         sort_by=args.sort,
@@ -4,45 +4,63 @@ Generate varied articles for MarkGo testing
 Creates medium to large articles with diverse content and topics
 
 Usage:
-    python3 scripts/generate_articles.py [number_of_articles] [output_directory]
-    
+    python3 scripts/generate_articles.py [number_of_articles] [output_directory] [--archive]
+
 Examples:
     python3 scripts/generate_articles.py 100 temp_articles
     python3 scripts/generate_articles.py 500 test_content
+    python3 scripts/generate_articles.py 500 test_content --archive  # writes test_content.tar
 """
 
+import io
 import os
+import re
 import sys
 import random
+import tarfile
+import multiprocessing
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
 # Article topics and categories
-CATEGORIES = [
+CATEGORIES = (
     "Technology", "Programming", "Web Development", "DevOps", "Cloud Computing",
     "Artificial Intelligence", "Machine Learning", "Data Science", "Cybersecurity",
     "Mobile Development", "Frontend", "Backend", "Database", "Architecture",
     "Tools", "Productivity", "Career", "Tutorial", "Review", "Opinion",
     "Industry News", "Open Source", "Performance", "Testing", "Debugging"
-]
+)
 
-TECH_TOPICS = [
+TECH_TOPICS = (
     "JavaScript", "Python", "Go", "Rust", "TypeScript", "React", "Vue.js", "Angular",
     "Node.js", "Docker", "Kubernetes", "AWS", "Azure", "GCP", "MongoDB", "PostgreSQL",
     "Redis", "Elasticsearch", "GraphQL", "REST API", "Microservices", "Serverless",
     "CI/CD", "Git", "Linux", "Bash", "Vim", "VS Code", "IntelliJ", "Terraform",
     "Ansible", "Jenkins", "GitHub Actions", "GitLab", "Nginx", "Apache", "MySQL",
     "SQLite", "Firebase", "Supabase", "Vercel", "Netlify", "Heroku", "DigitalOcean"
-]
+)
+
+# Tag forms, lowered and hyphenated once at import so the per-article
+# path never re-transforms these constant strings
+CATEGORY_TAGS = tuple(c.lower().replace(' ', '-') for c in CATEGORIES)
+TECH_TAGS = tuple(t.lower().replace(' ', '-') for t in TECH_TOPICS)
+
+# Contextual tags per article type; types without extras fall back to
+# the empty tuple
+_TYPE_TAGS = {
+    "tutorial": ("tutorial", "step-by-step", "guide"),
+    "review": ("review", "analysis", "comparison"),
+    "opinion": ("opinion", "thoughts", "perspective"),
+}
 
-FRAMEWORKS = [
+FRAMEWORKS = (
     "Spring Boot", "Django", "Flask", "FastAPI", "Express.js", "Gin", "Fiber",
     "Laravel", "Rails", "Phoenix", "Next.js", "Nuxt.js", "Svelte", "Remix",
     "Astro", "Gatsby", "Hugo", "Jekyll", "Eleventy", "Tailwind CSS", "Bootstrap",
     "Material UI", "Chakra UI", "Ant Design", "Styled Components", "Sass", "LESS"
-]
+)
 
-TOPICS_POOL = [
+TOPICS_POOL = (
     # Programming Languages
     "The Evolution of {lang} in Modern Development",
     "Why {lang} is Perfect for {type} Applications",
@@ -112,10 +130,10 @@ TOPICS_POOL = [
     "Predictions for {field} in the Next Decade",
     "Why {concept} is the Next Big Thing",
     "The Rise and Fall of {technology}",
-]
+)
 
 # Content templates for different article types
-TUTORIAL_SECTIONS = [
+TUTORIAL_SECTIONS = (
     "## Prerequisites\n\nBefore we begin, make sure you have:",
     "## Setting Up the Environment\n\nFirst, let's set up our development environment:",
     "## Step-by-Step Implementation\n\nNow let's implement the solution step by step:",
@@ -126,9 +144,9 @@ TUTORIAL_SECTIONS = [
     "## Security Considerations\n\nFrom a security perspective:",
     "## Deployment and Production\n\nWhen deploying to production:",
     "## Conclusion\n\nIn this tutorial, we've covered:",
-]
+)
 
-REVIEW_SECTIONS = [
+REVIEW_SECTIONS = (
     "## Introduction\n\nIn this comprehensive review, we'll examine:",
     "## Key Features\n\nThe standout features include:",
     "## Performance Analysis\n\nOur performance testing revealed:",
@@ -139,9 +157,9 @@ REVIEW_SECTIONS = [
     "## Pricing and Value\n\nFrom a cost perspective:",
     "## Community and Support\n\nThe community ecosystem offers:",
     "## Final Verdict\n\nAfter extensive testing:",
-]
+)
 
-OPINION_SECTIONS = [
+OPINION_SECTIONS = (
     "## The Current State of Affairs\n\nLooking at the current landscape:",
     "## Why This Matters\n\nThis topic is crucial because:",
     "## Different Perspectives\n\nThere are several viewpoints to consider:",
@@ -150,26 +168,169 @@ OPINION_SECTIONS = [
     "## Future Outlook\n\nLooking ahead, we can expect:",
     "## Recommendations\n\nBased on this analysis, I recommend:",
     "## Call to Action\n\nWhat can we do about this?",
-]
+)
+
+# Combined pool for general articles, concatenated once at import
+ALL_SECTIONS = TUTORIAL_SECTIONS + REVIEW_SECTIONS + OPINION_SECTIONS
+
+
+class _Sections:
+    """Section pool with its length and sample lower bound precomputed"""
+
+    __slots__ = ('items', 'n', 'low')
+
+    def __init__(self, items):
+        self.items = tuple(items)
+        self.n = len(self.items)
+        self.low = min(4, self.n)
+
+
+_TUTORIAL = _Sections(TUTORIAL_SECTIONS)
+_REVIEW = _Sections(REVIEW_SECTIONS)
+_OPINION = _Sections(OPINION_SECTIONS)
+
+SENTENCE_TEMPLATES = (
+    "This approach provides {benefit} while maintaining {quality}.",
+    "When implementing {feature}, it's important to consider {consideration}.",
+    "The {technology} ecosystem offers {advantage} for {use_case}.",
+    "Many developers overlook {aspect} when working with {tool}.",
+    "Performance benchmarks show {metric} improvement over {comparison}.",
+    "The key to successful {process} lies in {factor}.",
+    "Modern {field} practices emphasize {principle} and {value}.",
+    "Integration with {service} enables {capability} across {scope}.",
+    "Security researchers recommend {practice} to prevent {threat}.",
+    "The latest version introduces {feature} for better {outcome}.",
+    "Community feedback indicates strong preference for {approach}.",
+    "Documentation clearly outlines the steps for {process}.",
+    "Error handling becomes crucial when dealing with {scenario}.",
+    "The configuration file should specify {parameter} for optimal {result}.",
+    "Testing frameworks provide {functionality} to ensure {quality}."
+)
+
+_BENEFITS = ("better performance", "improved scalability", "enhanced security", "greater flexibility",
+             "reduced complexity", "faster development", "better maintainability", "improved user experience")
+
+# Value pools keyed by placeholder name; tuples since random.choice
+# indexes them millions of times. {metric} is generated dynamically in
+# generate_sentence.
+SENTENCE_POOLS = {
+    "benefit": _BENEFITS,
+    "advantage": _BENEFITS,
+    "quality": ("code quality", "system stability", "data integrity", "user privacy", "application security"),
+    "technology": ("React", "Node.js", "Docker", "Kubernetes", "PostgreSQL", "Redis", "GraphQL", "TypeScript"),
+    "feature": ("authentication", "caching", "routing", "state management", "data validation", "error tracking"),
+    "consideration": ("performance implications", "security vulnerabilities", "scalability requirements", "browser compatibility"),
+    "tool": tuple(TECH_TOPICS),
+    "use_case": ("web applications", "mobile apps", "APIs", "microservices", "data processing"),
+    "aspect": ("error handling", "performance optimization", "security", "testing", "documentation"),
+    "comparison": ("previous versions",),
+    "process": ("deployment", "testing", "development", "debugging", "optimization"),
+    "factor": ("proper planning", "team collaboration", "clear documentation", "automated testing"),
+    "field": ("software development", "web development", "DevOps", "data engineering"),
+    "principle": ("DRY principles", "SOLID principles", "clean code", "test-driven development"),
+    "value": ("maintainability", "readability", "performance", "security"),
+    "service": ("AWS", "Azure", "Google Cloud", "GitHub", "Docker Hub"),
+    "capability": ("seamless scaling", "automated deployment", "real-time monitoring", "data synchronization"),
+    "scope": ("multiple environments", "different platforms", "various devices", "global regions"),
+    "practice": ("input validation", "secure authentication", "encrypted communication", "regular updates"),
+    "threat": ("XSS attacks", "SQL injection", "data breaches", "unauthorized access"),
+    "outcome": ("performance", "reliability", "security", "usability"),
+    "approach": ("declarative syntax", "functional programming", "microservices architecture", "containerization"),
+    "functionality": ("mocking capabilities", "assertion libraries", "coverage reporting", "parallel execution"),
+    "scenario": ("network failures", "high traffic", "data corruption", "service outages"),
+    "parameter": ("timeout values", "cache expiration", "connection pools", "retry policies"),
+    "result": ("performance", "reliability", "efficiency", "throughput")
+}
+
+# Dedicated PRNG instance. The random module's functions are attribute
+# lookups on a hidden global instance; binding the methods of our own
+# instance once gives every hot call a direct reference, and seeding is
+# explicit per worker task in _build_article.
+_RNG = random.Random()
+_choice = _RNG.choice
+_randint = _RNG.randint
+_random = _RNG.random
+_sample = _RNG.sample
+
+_PLACEHOLDER_RE = re.compile(r'\{([a-z_0-9]+)\}')
+
+
+def _compile_template(template: str):
+    """Split a template into (literal segments, placeholder keys)"""
+    pieces = _PLACEHOLDER_RE.split(template)
+    return tuple(pieces[::2]), tuple(pieces[1::2])
+
+
+# Templates tokenized once at import; rendering a sentence is then one
+# pool lookup per placeholder instead of ~25 full-string replace scans.
+COMPILED_SENTENCE_TEMPLATES = tuple(_compile_template(t) for t in SENTENCE_TEMPLATES)
+
+# Value pools for title placeholders. Title templates are tokenized the
+# same way as sentence templates, so building a title only draws the
+# pools its template actually references.
+TITLE_POOLS = {
+    "lang": ("JavaScript", "Python", "Go", "TypeScript", "Rust"),
+    "type": ("web", "mobile", "enterprise", "cloud-native"),
+    "framework": FRAMEWORKS,
+    "tool": TECH_TOPICS,
+    "tool1": TECH_TOPICS,
+    "tool2": TECH_TOPICS,
+    "field": ("Software Development", "DevOps", "Data Science"),
+    "role": ("Frontend", "Backend", "Full-Stack", "DevOps"),
+    "old_role": ("Junior", "Mid-Level"),
+    "new_role": ("Senior", "Lead", "Principal"),
+    "task": ("building a REST API", "setting up CI/CD", "implementing authentication"),
+    "project": ("a blog engine", "a task manager", "an e-commerce site"),
+    "tech": TECH_TOPICS,
+    "environment": ("production", "development", "staging"),
+    "issue": ("memory leaks", "performance issues", "connection errors"),
+    "application": ("web applications", "mobile apps", "microservices"),
+    "metric": ("response time", "throughput", "memory usage"),
+    "old_tech": TECH_TOPICS,
+    "new_tech": TECH_TOPICS,
+    "process": ("deployment", "testing", "monitoring"),
+    "technology": TECH_TOPICS + ("AI", "Machine Learning", "Blockchain"),
+    "trend": ("AI integration", "edge computing", "serverless architecture"),
+    "domain": ("web development", "mobile development", "cloud computing"),
+    "industry": ("fintech", "healthcare", "e-commerce"),
+    "concept": ("edge computing", "quantum computing", "Web3"),
+    "feature": ("authentication", "caching", "routing", "state management"),
+    "consideration": ("performance", "security", "scalability", "maintainability"),
+    "platform": ("AWS", "Azure", "Google Cloud", "Kubernetes"),
+    "cloud": ("AWS", "Azure", "Google Cloud"),
+    "category": ("development tools", "frameworks", "databases", "cloud services"),
+    "product": TECH_TOPICS,
+    "old_tool": TECH_TOPICS,
+    "new_tool": TECH_TOPICS,
+}
+
+COMPILED_TITLE_TEMPLATES = tuple(_compile_template(t) for t in TOPICS_POOL)
+
+_ARTICLE_TYPES = ("tutorial", "review", "opinion", "guide", "analysis", "comparison")
+_SNIPPET_LANGS = ("javascript", "python", "go", "bash")
+
+
+def generate_random_content(sections: _Sections, min_paragraphs: int = 3, max_paragraphs: int = 8) -> str:
+    """Generate random content using the provided section pool"""
+    # Collect fragments and join once at the end — repeated += on a
+    # growing string is quadratic in the number of paragraphs
+    parts = []
+    randint = _randint
+
+    for section in _sample(sections.items, randint(sections.low, sections.n)):
+        parts.extend((section, "\n\n"))
 
-def generate_random_content(sections: List[str], min_paragraphs: int = 3, max_paragraphs: int = 8) -> str:
-    """Generate random content using the provided sections"""
-    content = ""
-    
-    for section in random.sample(sections, random.randint(min(4, len(sections)), len(sections))):
-        content += section + "\n\n"
-        
         # Add 2-5 paragraphs per section
-        num_paragraphs = random.randint(min_paragraphs, max_paragraphs)
+        num_paragraphs = randint(min_paragraphs, max_paragraphs)
         for _ in range(num_paragraphs):
-            content += generate_paragraph() + "\n\n"
-    
-    return content
+            parts.extend((generate_paragraph(), "\n\n"))
+
+    return "".join(parts)
 
 def generate_paragraph() -> str:
     """Generate a realistic paragraph of technical content"""
     sentences = []
-    num_sentences = random.randint(3, 7)
+    num_sentences = _randint(3, 7)
     
     for _ in range(num_sentences):
         sentences.append(generate_sentence())
@@ -178,73 +339,23 @@ def generate_paragraph() -> str:
 
 def generate_sentence() -> str:
     """Generate a realistic technical sentence"""
-    sentence_templates = [
-        "This approach provides {benefit} while maintaining {quality}.",
-        "When implementing {feature}, it's important to consider {consideration}.",
-        "The {technology} ecosystem offers {advantage} for {use_case}.",
-        "Many developers overlook {aspect} when working with {tool}.",
-        "Performance benchmarks show {metric} improvement over {comparison}.",
-        "The key to successful {process} lies in {factor}.",
-        "Modern {field} practices emphasize {principle} and {value}.",
-        "Integration with {service} enables {capability} across {scope}.",
-        "Security researchers recommend {practice} to prevent {threat}.",
-        "The latest version introduces {feature} for better {outcome}.",
-        "Community feedback indicates strong preference for {approach}.",
-        "Documentation clearly outlines the steps for {process}.",
-        "Error handling becomes crucial when dealing with {scenario}.",
-        "The configuration file should specify {parameter} for optimal {result}.",
-        "Testing frameworks provide {functionality} to ensure {quality}."
-    ]
-    
-    benefits = ["better performance", "improved scalability", "enhanced security", "greater flexibility", 
-               "reduced complexity", "faster development", "better maintainability", "improved user experience"]
-    qualities = ["code quality", "system stability", "data integrity", "user privacy", "application security"]
-    technologies = ["React", "Node.js", "Docker", "Kubernetes", "PostgreSQL", "Redis", "GraphQL", "TypeScript"]
-    features = ["authentication", "caching", "routing", "state management", "data validation", "error tracking"]
-    considerations = ["performance implications", "security vulnerabilities", "scalability requirements", "browser compatibility"]
-    
-    template = random.choice(sentence_templates)
-    
-    # Fill in template placeholders
-    replacements = {
-        "{benefit}": random.choice(benefits),
-        "{quality}": random.choice(qualities),
-        "{technology}": random.choice(technologies),
-        "{feature}": random.choice(features),
-        "{consideration}": random.choice(considerations),
-        "{tool}": random.choice(TECH_TOPICS),
-        "{advantage}": random.choice(benefits),
-        "{use_case}": random.choice(["web applications", "mobile apps", "APIs", "microservices", "data processing"]),
-        "{aspect}": random.choice(["error handling", "performance optimization", "security", "testing", "documentation"]),
-        "{metric}": f"{random.randint(15, 85)}%",
-        "{comparison}": "previous versions",
-        "{process}": random.choice(["deployment", "testing", "development", "debugging", "optimization"]),
-        "{factor}": random.choice(["proper planning", "team collaboration", "clear documentation", "automated testing"]),
-        "{field}": random.choice(["software development", "web development", "DevOps", "data engineering"]),
-        "{principle}": random.choice(["DRY principles", "SOLID principles", "clean code", "test-driven development"]),
-        "{value}": random.choice(["maintainability", "readability", "performance", "security"]),
-        "{service}": random.choice(["AWS", "Azure", "Google Cloud", "GitHub", "Docker Hub"]),
-        "{capability}": random.choice(["seamless scaling", "automated deployment", "real-time monitoring", "data synchronization"]),
-        "{scope}": random.choice(["multiple environments", "different platforms", "various devices", "global regions"]),
-        "{practice}": random.choice(["input validation", "secure authentication", "encrypted communication", "regular updates"]),
-        "{threat}": random.choice(["XSS attacks", "SQL injection", "data breaches", "unauthorized access"]),
-        "{outcome}": random.choice(["performance", "reliability", "security", "usability"]),
-        "{approach}": random.choice(["declarative syntax", "functional programming", "microservices architecture", "containerization"]),
-        "{functionality}": random.choice(["mocking capabilities", "assertion libraries", "coverage reporting", "parallel execution"]),
-        "{scenario}": random.choice(["network failures", "high traffic", "data corruption", "service outages"]),
-        "{parameter}": random.choice(["timeout values", "cache expiration", "connection pools", "retry policies"]),
-        "{result}": random.choice(["performance", "reliability", "efficiency", "throughput"])
-    }
-    
-    for placeholder, value in replacements.items():
-        template = template.replace(placeholder, value)
-    
-    return template
-
-def generate_code_snippet(language: str) -> str:
-    """Generate a realistic code snippet"""
-    if language.lower() in ["javascript", "js", "typescript", "ts"]:
-        return '''```javascript
+    # Bind hot lookups locally — this runs millions of times per batch
+    choice = _choice
+    literals, keys = choice(COMPILED_SENTENCE_TEMPLATES)
+
+    # Interleave literal segments with one random pool pick per
+    # placeholder actually present in the chosen template
+    parts = [literals[0]]
+    for i, key in enumerate(keys):
+        if key == "metric":
+            parts.append(f"{_randint(15, 85)}%")
+        else:
+            parts.append(choice(SENTENCE_POOLS[key]))
+        parts.append(literals[i + 1])
+
+    return "".join(parts)
+
+JS_SNIPPET = '''```javascript
 // Example implementation
 const fetchUserData = async (userId) => {
   try {
@@ -265,9 +376,8 @@ fetchUserData('123')
   .then(user => console.log('User data:', user))
   .catch(error => console.error('Failed to fetch user:', error));
 ```'''
-    
-    elif language.lower() in ["python", "py"]:
-        return '''```python
+
+PY_SNIPPET = '''```python
 import asyncio
 import aiohttp
 from typing import Dict, Any
@@ -294,9 +404,8 @@ async def main():
 if __name__ == "__main__":
     asyncio.run(main())
 ```'''
-    
-    elif language.lower() in ["go", "golang"]:
-        return '''```go
+
+GO_SNIPPET = '''```go
 package main
 
 import (
@@ -345,9 +454,8 @@ func main() {
     fmt.Printf("User: %+v\n", user)
 }
 ```'''
-    
-    else:
-        return '''```bash
+
+BASH_SNIPPET = '''```bash
 #!/bin/bash
 
 # Example deployment script
@@ -375,218 +483,252 @@ kubectl rollout status deployment/$APP_NAME
 echo "Deployment completed successfully!"
 ```'''
 
+# Snippets are fixed text, so hand out shared module-level constants
+# keyed by normalized language token instead of rebuilding multi-KB
+# strings per call. Bash doubles as the catch-all default.
+_SNIPPETS = {
+    'javascript': JS_SNIPPET, 'js': JS_SNIPPET,
+    'typescript': JS_SNIPPET, 'ts': JS_SNIPPET,
+    'python': PY_SNIPPET, 'py': PY_SNIPPET,
+    'go': GO_SNIPPET, 'golang': GO_SNIPPET,
+}
+
+
+def generate_code_snippet(language: str) -> str:
+    """Generate a realistic code snippet"""
+    return _SNIPPETS.get(language.lower(), BASH_SNIPPET)
+
+# Description templates and author pool live at module level so
+# generate_frontmatter picks one and formats it instead of rendering all
+# eight variants per article
+_DESC_TEMPLATES = (
+    "A comprehensive guide to {t} covering best practices and real-world examples.",
+    "Learn about {t} with practical examples and expert insights.",
+    "Deep dive into {t} - from basics to advanced techniques.",
+    "Everything you need to know about {t} in modern development.",
+    "Practical guide to implementing {t} in your projects.",
+    "Master {t} with this detailed tutorial and examples.",
+    "Complete overview of {t} with hands-on examples.",
+    "Expert insights on {t} for modern developers.",
+)
+
+_AUTHORS = (
+    "Alex Chen", "Sarah Johnson", "Michael Rodriguez", "Emily Zhang", "David Kim",
+    "Jessica Wong", "Ryan O'Connor", "Lisa Thompson", "Ahmed Hassan", "Maria Garcia",
+    "James Wilson", "Priya Patel", "Tom Anderson", "Rachel Green", "Kevin Liu",
+    "Anna Kowalski", "Carlos Mendez", "Sophie Martin", "Jake Peterson", "Nina Popov",
+)
+
 def generate_article_content(title: str, category: str, article_type: str) -> str:
     """Generate comprehensive article content based on type"""
-    content = ""
-    
     # Introduction
-    content += f"In this comprehensive guide, we'll explore {title.lower()}. "
-    content += f"This {article_type} covers everything from basic concepts to advanced techniques, "
-    content += f"providing practical insights for developers working in {category.lower()}.\n\n"
-    
+    parts = [
+        f"In this comprehensive guide, we'll explore {title.lower()}. ",
+        f"This {article_type} covers everything from basic concepts to advanced techniques, ",
+        f"providing practical insights for developers working in {category.lower()}.\n\n",
+    ]
+
     # Add type-specific content
     if article_type == "tutorial":
-        content += generate_random_content(TUTORIAL_SECTIONS, 4, 8)
+        parts.append(generate_random_content(_TUTORIAL, 4, 8))
         # Add code snippets
-        languages = ["javascript", "python", "go", "bash"]
-        for _ in range(random.randint(2, 4)):
-            content += f"\n{generate_code_snippet(random.choice(languages))}\n\n"
-            content += generate_paragraph() + "\n\n"
-    
+        for _ in range(_randint(2, 4)):
+            parts.append(f"\n{generate_code_snippet(_choice(_SNIPPET_LANGS))}\n\n")
+            parts.append(generate_paragraph())
+            parts.append("\n\n")
+
     elif article_type == "review":
-        content += generate_random_content(REVIEW_SECTIONS, 3, 6)
-    
+        parts.append(generate_random_content(_REVIEW, 3, 6))
+
     elif article_type == "opinion":
-        content += generate_random_content(OPINION_SECTIONS, 4, 7)
-    
+        parts.append(generate_random_content(_OPINION, 4, 7))
+
     else:  # general article
-        all_sections = TUTORIAL_SECTIONS + REVIEW_SECTIONS + OPINION_SECTIONS
-        content += generate_random_content(random.sample(all_sections, random.randint(5, 8)), 3, 6)
-        
+        parts.append(generate_random_content(_Sections(_sample(ALL_SECTIONS, _randint(5, 8))), 3, 6))
+
         # Add occasional code snippet
-        if random.random() < 0.6:  # 60% chance
-            languages = ["javascript", "python", "go", "bash"]
-            content += f"\n{generate_code_snippet(random.choice(languages))}\n\n"
-    
+        if _random() < 0.6:  # 60% chance
+            parts.append(f"\n{generate_code_snippet(_choice(_SNIPPET_LANGS))}\n\n")
+
     # Add conclusion
-    content += "## Conclusion\n\n"
-    content += generate_paragraph() + "\n\n"
-    content += generate_paragraph() + "\n\n"
-    
+    parts.extend(("## Conclusion\n\n",
+                  generate_paragraph(), "\n\n",
+                  generate_paragraph(), "\n\n"))
+
     # Add call to action
-    if random.random() < 0.3:  # 30% chance
-        content += "## What's Next?\n\n"
-        content += generate_paragraph() + "\n\n"
-    
-    return content
+    if _random() < 0.3:  # 30% chance
+        parts.extend(("## What's Next?\n\n", generate_paragraph(), "\n\n"))
+
+    return "".join(parts)
 
-def generate_frontmatter(title: str, category: str, date: datetime, tags: List[str], article_type: str) -> str:
+def generate_frontmatter(title: str, category: str, date_str: str, tags: List[str], article_type: str) -> str:
     """Generate YAML frontmatter for article"""
-    
-    # Generate description
-    descriptions = [
-        f"A comprehensive guide to {title.lower()} covering best practices and real-world examples.",
-        f"Learn about {title.lower()} with practical examples and expert insights.",
-        f"Deep dive into {title.lower()} - from basics to advanced techniques.",
-        f"Everything you need to know about {title.lower()} in modern development.",
-        f"Practical guide to implementing {title.lower()} in your projects.",
-        f"Master {title.lower()} with this detailed tutorial and examples.",
-        f"Complete overview of {title.lower()} with hands-on examples.",
-        f"Expert insights on {title.lower()} for modern developers."
-    ]
-    
-    authors = [
-        "Alex Chen", "Sarah Johnson", "Michael Rodriguez", "Emily Zhang", "David Kim",
-        "Jessica Wong", "Ryan O'Connor", "Lisa Thompson", "Ahmed Hassan", "Maria Garcia",
-        "James Wilson", "Priya Patel", "Tom Anderson", "Rachel Green", "Kevin Liu",
-        "Anna Kowalski", "Carlos Mendez", "Sophie Martin", "Jake Peterson", "Nina Popov"
-    ]
-    
+
+    # Lowercase the title once; it appears in every description variant
+    title_lower = title.lower()
+
+    # Pick one template, then format only that one
+    description = _choice(_DESC_TEMPLATES).format(t=title_lower)
+
     frontmatter = f"""---
 title: "{title}"
-description: "{random.choice(descriptions)}"
-date: {date.strftime('%Y-%m-%dT%H:%M:%SZ')}
+description: "{description}"
+date: {date_str}T00:00:00Z
 tags: {tags}
 categories: ["{category}"]
-featured: {str(random.random() < 0.15).lower()}
-draft: {str(random.random() < 0.1).lower()}
-author: "{random.choice(authors)}"
-reading_time: {random.randint(5, 25)} min
+featured: {str(_random() < 0.15).lower()}
+draft: {str(_random() < 0.1).lower()}
+author: "{_choice(_AUTHORS)}"
+reading_time: {_randint(5, 25)} min
 seo_title: "{title} - Complete Guide"
-seo_description: "Learn {title.lower()} with practical examples, best practices, and expert insights. Comprehensive tutorial for developers."
+seo_description: "Learn {title_lower} with practical examples, best practices, and expert insights. Comprehensive tutorial for developers."
 ---
 
 """
     return frontmatter
 
-def generate_filename(title: str, date: datetime) -> str:
+# Translation table for slugifying titles: spaces become hyphens, other
+# non-alphanumeric ASCII is dropped. Built once; str.translate then
+# cleans a title in a single C-level pass.
+_FILENAME_TABLE = {ord(c): None for c in map(chr, range(128))
+                   if not (c.isalnum() or c in ' -')}
+_FILENAME_TABLE[ord(' ')] = ord('-')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+
+
+def generate_filename(title: str, date_str: str) -> str:
     """Generate filename from title and date"""
-    # Clean title for filename
-    clean_title = title.lower()
-    clean_title = ''.join(c if c.isalnum() or c in ' -' else '' for c in clean_title)
-    clean_title = '-'.join(clean_title.split())
+    clean_title = title.lower().translate(_FILENAME_TABLE)
+    clean_title = _HYPHEN_RUN_RE.sub('-', clean_title).strip('-')
     clean_title = clean_title[:80]  # Limit length
-    
-    return f"{date.strftime('%Y-%m-%d')}-{clean_title}.md"
 
-def generate_articles(num_articles: int = 500, output_dir: str = "temp_articles") -> None:
-    """Generate the specified number of articles"""
-    
-    # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Generate date range (last 3 years)
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=1095)  # ~3 years
-    
-    article_types = ["tutorial", "review", "opinion", "guide", "analysis", "comparison"]
-    
-    print(f"Generating {num_articles} articles in {output_dir}/...")
-    
-    for i in range(num_articles):
-        # Generate random date
-        random_days = random.randint(0, 1095)
-        article_date = start_date + timedelta(days=random_days)
-        
-        # Select random elements
-        category = random.choice(CATEGORIES)
-        article_type = random.choice(article_types)
-        
-        # Generate title
-        title_template = random.choice(TOPICS_POOL)
-        
-        # Create a comprehensive replacement dictionary
-        replacements = {
-            "lang": random.choice(["JavaScript", "Python", "Go", "TypeScript", "Rust"]),
-            "type": random.choice(["web", "mobile", "enterprise", "cloud-native"]),
-            "framework": random.choice(FRAMEWORKS),
-            "tool": random.choice(TECH_TOPICS),
-            "tool1": random.choice(TECH_TOPICS),
-            "tool2": random.choice(TECH_TOPICS),
-            "field": random.choice(["Software Development", "DevOps", "Data Science"]),
-            "role": random.choice(["Frontend", "Backend", "Full-Stack", "DevOps"]),
-            "old_role": random.choice(["Junior", "Mid-Level"]),
-            "new_role": random.choice(["Senior", "Lead", "Principal"]),
-            "task": random.choice(["building a REST API", "setting up CI/CD", "implementing authentication"]),
-            "project": random.choice(["a blog engine", "a task manager", "an e-commerce site"]),
-            "tech": random.choice(TECH_TOPICS),
-            "environment": random.choice(["production", "development", "staging"]),
-            "issue": random.choice(["memory leaks", "performance issues", "connection errors"]),
-            "application": random.choice(["web applications", "mobile apps", "microservices"]),
-            "metric": random.choice(["response time", "throughput", "memory usage"]),
-            "old_tech": random.choice(TECH_TOPICS),
-            "new_tech": random.choice(TECH_TOPICS),
-            "process": random.choice(["deployment", "testing", "monitoring"]),
-            "technology": random.choice(TECH_TOPICS + ["AI", "Machine Learning", "Blockchain"]),
-            "trend": random.choice(["AI integration", "edge computing", "serverless architecture"]),
-            "domain": random.choice(["web development", "mobile development", "cloud computing"]),
-            "industry": random.choice(["fintech", "healthcare", "e-commerce"]),
-            "concept": random.choice(["edge computing", "quantum computing", "Web3"]),
-            "feature": random.choice(["authentication", "caching", "routing", "state management"]),
-            "consideration": random.choice(["performance", "security", "scalability", "maintainability"]),
-            "platform": random.choice(["AWS", "Azure", "Google Cloud", "Kubernetes"]),
-            "cloud": random.choice(["AWS", "Azure", "Google Cloud"]),
-            "category": random.choice(["development tools", "frameworks", "databases", "cloud services"]),
-            "product": random.choice(TECH_TOPICS),
-            "old_tool": random.choice(TECH_TOPICS),
-            "new_tool": random.choice(TECH_TOPICS)
-        }
-        
-        # Apply all replacements to handle any combination
-        title = title_template
-        for placeholder, value in replacements.items():
-            title = title.replace(f"{{{placeholder}}}", value)
-        
-        # Generate tags
-        base_tags = [category.lower().replace(" ", "-")]
-        tech_tags = random.sample(TECH_TOPICS, random.randint(2, 5))
-        base_tags.extend([tag.lower().replace(" ", "-") for tag in tech_tags])
-        
-        # Additional contextual tags
-        if article_type == "tutorial":
-            base_tags.extend(["tutorial", "step-by-step", "guide"])
-        elif article_type == "review":
-            base_tags.extend(["review", "analysis", "comparison"])
-        elif article_type == "opinion":
-            base_tags.extend(["opinion", "thoughts", "perspective"])
-        
-        tags = list(set(base_tags[:8]))  # Limit to 8 unique tags
-        
-        # Generate content
-        frontmatter = generate_frontmatter(title, category, article_date, tags, article_type)
-        content = generate_article_content(title, category, article_type)
-        
-        # Create filename
-        filename = generate_filename(title, article_date)
-        filepath = os.path.join(output_dir, filename)
-        
-        # Write article
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(frontmatter)
-            f.write(content)
-        
-        if (i + 1) % 50 == 0:
-            print(f"Generated {i + 1}/{num_articles} articles...")
-    
-    print(f"\nSuccessfully generated {num_articles} articles in {output_dir}/")
-    print(f"Articles range from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
+    return f"{date_str}-{clean_title}.md"
+
+def _build_article(args) -> tuple:
+    """Build a single article in a worker process.
+
+    Takes (index, start_ordinal) and returns (filename, full text).
+    Seeded per task so output is reproducible and forked workers don't
+    share one PRNG state.
+    """
+    i, start_ord = args
+    _RNG.seed(i)
+
+    # Bind RNG methods once; the code below calls them constantly
+    choice = _choice
+    randint = _randint
+    sample = _sample
+
+    # Random date via ordinal arithmetic, formatted once and reused for
+    # both the frontmatter and the filename
+    date_str = datetime.fromordinal(start_ord + randint(0, 1095)).strftime('%Y-%m-%d')
+
+    # Select random elements; picking the category by index lets the
+    # precomputed tag form be looked up instead of rebuilt
+    category_index = randint(0, len(CATEGORIES) - 1)
+    category = CATEGORIES[category_index]
+    article_type = choice(_ARTICLE_TYPES)
+
+    # Render the title from a pre-tokenized template, drawing only the
+    # pools its placeholders reference instead of filling a 30-entry
+    # replacement dict per article
+    literals, keys = choice(COMPILED_TITLE_TEMPLATES)
+    parts = [literals[0]]
+    for k, key in enumerate(keys):
+        parts.append(choice(TITLE_POOLS[key]))
+        parts.append(literals[k + 1])
+    title = "".join(parts)
+
+    # Generate tags: category form, sampled tech tags, then contextual
+    # tags for the article type, deduped in insertion order and capped.
+    # set() would shuffle the tags and could drop uniques past index 8.
+    tags = list(dict.fromkeys(
+        (CATEGORY_TAGS[category_index],
+         *sample(TECH_TAGS, randint(2, 5)),
+         *_TYPE_TAGS.get(article_type, ()))
+    ))[:8]
+    
+    # Generate content
+    frontmatter = generate_frontmatter(title, category, date_str, tags, article_type)
+    content = generate_article_content(title, category, article_type)
+
+    # Create filename
+    filename = generate_filename(title, date_str)
+
+    return filename, frontmatter + content
+
+
+def generate_articles(num_articles: int = 500, output_dir: str = "temp_articles",
+                      archive: bool = False) -> None:
+    """Generate the specified number of articles.
+
+    With archive=True the articles are streamed into a single
+    uncompressed <output_dir>.tar instead of one file each, turning
+    thousands of small creates into sequential writes to one file.
+    """
+
+    # Date range (last 3 years) as an ordinal so workers draw dates with
+    # plain integer arithmetic
+    start_ord = (datetime.now() - timedelta(days=1095)).toordinal()
+
+    # Article building is pure CPU work with no shared state, so fan it
+    # out across cores; the parent stays the single writer so filesystem
+    # access remains serialized.
+    tasks = ((i, start_ord) for i in range(num_articles))
+    written = 0
+    with multiprocessing.Pool() as pool:
+        results = pool.imap_unordered(_build_article, tasks, chunksize=32)
+
+        if archive:
+            archive_path = output_dir.rstrip('/') + '.tar'
+            print(f"Generating {num_articles} articles into {archive_path}...")
+            mtime = int(datetime.now().timestamp())
+            with tarfile.open(archive_path, 'w') as tar:
+                for filename, text in results:
+                    data = text.encode('utf-8')
+                    info = tarfile.TarInfo(name=filename)
+                    info.size = len(data)
+                    info.mtime = mtime
+                    tar.addfile(info, io.BytesIO(data))
+                    written += 1
+                    if written % 50 == 0:
+                        print(f"Generated {written}/{num_articles} articles...")
+            print(f"\nSuccessfully generated {num_articles} articles in {archive_path}")
+        else:
+            os.makedirs(output_dir, exist_ok=True)
+            print(f"Generating {num_articles} articles in {output_dir}/...")
+            for filename, text in results:
+                filepath = os.path.join(output_dir, filename)
+                # Encode once and write the bytes in one call, skipping
+                # the TextIOWrapper/codec layer entirely
+                with open(filepath, 'wb') as f:
+                    f.write(text.encode('utf-8'))
+                written += 1
+                if written % 50 == 0:
+                    print(f"Generated {written}/{num_articles} articles...")
+            print(f"\nSuccessfully generated {num_articles} articles in {output_dir}/")
+    print(f"Articles range from {datetime.fromordinal(start_ord).strftime('%Y-%m-%d')} "
+          f"to {datetime.fromordinal(start_ord + 1095).strftime('%Y-%m-%d')}")
 
 def main():
     """Main function to handle command line arguments"""
     # Parse command line arguments
     num_articles = 500
     output_dir = "temp_articles"
-    
-    if len(sys.argv) > 1:
+
+    args = [a for a in sys.argv[1:] if a != '--archive']
+    archive = len(args) < len(sys.argv) - 1
+
+    if len(args) > 0:
         try:
-            num_articles = int(sys.argv[1])
+            num_articles = int(args[0])
         except ValueError:
-            print(f"Error: '{sys.argv[1]}' is not a valid number")
+            print(f"Error: '{args[0]}' is not a valid number")
             sys.exit(1)
-    
-    if len(sys.argv) > 2:
-        output_dir = sys.argv[2]
-    
+
+    if len(args) > 1:
+        output_dir = args[1]
+
     # Validate arguments
     if num_articles <= 0:
         print("Error: Number of articles must be positive")
@@ -600,7 +742,7 @@ def main():
             sys.exit(0)
     
     # Generate articles
-    generate_articles(num_articles, output_dir)
+    generate_articles(num_articles, output_dir, archive=archive)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file